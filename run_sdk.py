@@ -31,11 +31,33 @@ async def run_trigger_example():
         await client.close()
 
 
+async def run_trigger_many_example():
+    client = WebhookClient(base_url=WEBHOOK_SERVICE_URL)
+    try:
+        response = await client.trigger_many(
+            [
+                ("payout.completed", {"object": {"id": "po_example_1"}}),
+                ("payout.completed", {"object": {"id": "po_example_2"}}),
+            ],
+        )
+        print("---------------------------------------------------------------")
+        print("Trigger Many Response:", response)
+        print("---------------------------------------------------------------")
+        return response
+    except Exception as e:
+        print("---------------------------------------------------------------")
+        print(f"Trigger Many failed: {e}")
+        print("---------------------------------------------------------------")
+    finally:
+        await client.close()
+
+
 async def main():
     print("---------------------------------------------------------------")
     print("TurnStay Webhooks SDK - Example")
     print("---------------------------------------------------------------")
     await run_trigger_example()
+    await run_trigger_many_example()
     print("---------------------------------------------------------------")
     print("Done.")
     print("---------------------------------------------------------------")
@@ -1,3 +1,11 @@
+import asyncio
+import json
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import httpx
 import pytest
 
 from turnstay_webhooks.client import WebhookClient
@@ -13,6 +21,10 @@ class TestWebhookClientInit:
         with pytest.raises(WebhookClientError, match="queue_url"):
             WebhookClient(mode="sqs")
 
+    def test_max_concurrency_must_be_positive(self):
+        with pytest.raises(WebhookClientError, match="max_concurrency"):
+            WebhookClient(base_url="http://localhost:8000", max_concurrency=0)
+
     def test_http_mode_valid(self):
         client = WebhookClient(base_url="http://localhost:8000")
         assert client.mode == "http"
@@ -30,3 +42,395 @@ class TestWebhookClientInit:
         assert client.timeout == 5.0
         assert client.max_retries == 3
         assert client.retry_delay == 1.0
+        assert client.max_concurrency == 10
+        assert client.max_retry_delay == 30.0
+
+
+class TestLazyImport:
+    def test_package_import_does_not_load_httpx(self):
+        code = (
+            "import sys, turnstay_webhooks; "
+            "assert 'httpx' not in sys.modules; "
+            "assert turnstay_webhooks.WebhookClient.__name__ == 'WebhookClient'; "
+            "assert 'httpx' in sys.modules"
+        )
+        repo_root = Path(__file__).resolve().parents[1]
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
+
+
+class TestWebhookClientSharedHttpClient:
+    async def test_uses_shared_client_with_auth_header(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"id": "evt_1"})
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(
+            api_key="key_123", base_url="http://localhost:8000", client=shared
+        )
+        result = await client.trigger("payout.completed", data={"object": {}})
+
+        assert result == {"id": "evt_1"}
+        assert seen[0].url == "http://localhost:8000/internal/webhooks/trigger"
+        assert seen[0].headers["Authorization"] == "Bearer key_123"
+        await shared.aclose()
+
+    async def test_headers_changed_after_init_are_sent(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(base_url="http://localhost:8000", client=shared)
+        client.headers["X-Request-Source"] = "tests"
+        await client.trigger("payout.completed", data={"object": {}})
+
+        assert seen[0].headers["X-Request-Source"] == "tests"
+        await shared.aclose()
+
+    async def test_close_leaves_shared_client_open(self):
+        shared = httpx.AsyncClient()
+        client = WebhookClient(base_url="http://localhost:8000", client=shared)
+        await client.close()
+        assert not shared.is_closed
+        await shared.aclose()
+
+    async def test_close_closes_owned_client(self):
+        client = WebhookClient(base_url="http://localhost:8000")
+        owned = client.http_client
+        await client.close()
+        assert owned.is_closed
+
+    async def test_retry_resends_serialized_body(self):
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            assert request.headers["Content-Type"] == "application/json"
+            if len(bodies) == 1:
+                return httpx.Response(503, text="unavailable")
+            return httpx.Response(200, json={"id": "evt_2"})
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(
+            base_url="http://localhost:8000", retry_delay=0, client=shared
+        )
+        result = await client.trigger("refund.completed", data={"object": {}})
+
+        assert result == {"id": "evt_2"}
+        assert len(bodies) == 2
+        assert bodies[0] == bodies[1]
+        assert json.loads(bodies[0])["event_type"] == "refund.completed"
+        await shared.aclose()
+
+    async def test_trigger_many_http(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            event_type = json.loads(request.content)["event_type"]
+            if event_type == "bad.event":
+                return httpx.Response(503, text="unavailable")
+            return httpx.Response(200, json={"event_type": event_type})
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(
+            base_url="http://localhost:8000",
+            max_retries=0,
+            client=shared,
+        )
+        results = await client.trigger_many(
+            [("refund.completed", {"object": {}}), ("bad.event", {"object": {}})]
+        )
+
+        assert results[0] == {"event_type": "refund.completed"}
+        assert isinstance(results[1], WebhookClientError)
+        await shared.aclose()
+
+    async def test_trigger_many_http_bounded_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json=json.loads(request.content)["data"])
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(
+            base_url="http://localhost:8000", max_concurrency=3, client=shared
+        )
+        events = [("payout.completed", {"object": {"id": i}}) for i in range(9)]
+        results = await client.trigger_many(events)
+
+        assert [r["object"]["id"] for r in results] == list(range(9))
+        assert 1 < peak <= 3
+        await shared.aclose()
+
+    async def test_trigger_many_cancels_pending_sends_on_error(self):
+        calls = 0
+        completed = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls, completed
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+            completed += 1
+            return httpx.Response(200, json={})
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(
+            base_url="http://localhost:8000", max_concurrency=1, client=shared
+        )
+        events = [("payout.completed", {"object": {}})] * 3
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await client.trigger_many(events)
+        await asyncio.sleep(0.05)
+        assert completed == 0
+        await shared.aclose()
+
+    async def test_unserializable_payload_raises_client_error(self):
+        client = WebhookClient(base_url="http://localhost:8000")
+        with pytest.raises(WebhookClientError, match="serialize"):
+            await client.trigger("payout.completed", data={"x": object()})
+        await client.close()
+
+
+class TestWebhookClientRetries:
+    @staticmethod
+    def _record_sleeps(monkeypatch) -> list[float]:
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("turnstay_webhooks.client.asyncio.sleep", fake_sleep)
+        return sleeps
+
+    async def test_honors_retry_after(self, monkeypatch):
+        sleeps = self._record_sleeps(monkeypatch)
+        responses = iter(
+            [
+                httpx.Response(503, headers={"Retry-After": "0"}),
+                httpx.Response(503, headers={"Retry-After": "120"}),
+                httpx.Response(200, json={"id": "evt_1"}),
+            ]
+        )
+        shared = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        )
+        client = WebhookClient(
+            base_url="http://localhost:8000", max_retry_delay=5.0, client=shared
+        )
+
+        assert await client.trigger("payout.completed", data={}) == {"id": "evt_1"}
+        assert sleeps == [0.0, 5.0]
+        await shared.aclose()
+
+    async def test_jitter_not_reset_by_retry_after(self, monkeypatch):
+        sleeps = self._record_sleeps(monkeypatch)
+        responses = iter(
+            [httpx.Response(503, headers={"Retry-After": "0"})]
+            + [httpx.Response(503)] * 3
+        )
+        shared = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        )
+        client = WebhookClient(
+            base_url="http://localhost:8000", retry_delay=1.0, client=shared
+        )
+
+        with pytest.raises(WebhookClientError):
+            await client.trigger("payout.completed", data={})
+        assert sleeps[0] == 0.0
+        assert all(delay >= 1.0 for delay in sleeps[1:])
+        await shared.aclose()
+
+    async def test_jittered_backoff_within_bounds(self, monkeypatch):
+        sleeps = self._record_sleeps(monkeypatch)
+        shared = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        client = WebhookClient(
+            base_url="http://localhost:8000",
+            max_retries=5,
+            retry_delay=1.0,
+            max_retry_delay=4.0,
+            client=shared,
+        )
+
+        with pytest.raises(WebhookClientError, match="after 6 attempts"):
+            await client.trigger("payout.completed", data={})
+        assert len(sleeps) == 5
+        assert all(1.0 <= delay <= 4.0 for delay in sleeps)
+        await shared.aclose()
+
+    async def test_non_retryable_server_error_fails_fast(self, monkeypatch):
+        sleeps = self._record_sleeps(monkeypatch)
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(501, text="not implemented")
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = WebhookClient(base_url="http://localhost:8000", client=shared)
+
+        with pytest.raises(WebhookClientError, match="^Server error 501"):
+            await client.trigger("payout.completed", data={})
+        assert calls == 1
+        assert sleeps == []
+        await shared.aclose()
+
+    async def test_retries_rate_limited(self, monkeypatch):
+        self._record_sleeps(monkeypatch)
+        responses = iter(
+            [httpx.Response(429), httpx.Response(200, json={"id": "evt_1"})]
+        )
+        shared = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        )
+        client = WebhookClient(base_url="http://localhost:8000", client=shared)
+
+        assert await client.trigger("payout.completed", data={}) == {"id": "evt_1"}
+        await shared.aclose()
+
+    async def test_invalid_json_response_raises_client_error(self):
+        shared = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text="not json")
+            )
+        )
+        client = WebhookClient(base_url="http://localhost:8000", client=shared)
+
+        with pytest.raises(WebhookClientError, match="Unexpected error"):
+            await client.trigger("payout.completed", data={})
+        await shared.aclose()
+
+
+class _FakeSQS:
+    def __init__(self):
+        self.messages: list[dict] = []
+        self.batches: list[dict] = []
+        self.fail_ids: set[str] = set()
+
+    async def send_message(self, **kwargs):
+        self.messages.append(kwargs)
+        return {"MessageId": "msg_1"}
+
+    async def send_message_batch(self, **kwargs):
+        self.batches.append(kwargs)
+        return {
+            "Successful": [],
+            "Failed": [
+                {"Id": e["Id"], "Code": "Throttled", "Message": "slow down"}
+                for e in kwargs["Entries"]
+                if e["Id"] in self.fail_ids
+            ],
+        }
+
+
+class TestWebhookClientSQS:
+    QUEUE_URL = "https://sqs.eu-west-1.amazonaws.com/123/queue"
+
+    async def test_missing_aioboto3_raises(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "aioboto3", None)
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        with pytest.raises(WebhookClientError, match="aioboto3"):
+            await client.trigger("payout.completed", data={"object": {}})
+
+    @staticmethod
+    def _install_failing_aioboto3(monkeypatch):
+        class FailingContext:
+            async def __aenter__(self):
+                raise RuntimeError("no region")
+
+        class Session:
+            def client(self, *args, **kwargs):
+                return FailingContext()
+
+        monkeypatch.setitem(
+            sys.modules, "aioboto3", types.SimpleNamespace(Session=Session)
+        )
+
+    async def test_trigger_many_reports_unserializable_payload_per_event(self):
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        client._sqs = fake = _FakeSQS()
+        events = [("payout.completed", {"object": {"id": i}}) for i in range(10)]
+        events.insert(3, ("payout.completed", {"object": object()}))
+
+        results = await client.trigger_many(events)
+
+        assert len(results) == 11
+        assert isinstance(results[3], WebhookClientError)
+        assert results[:3] + results[4:] == [None] * 10
+        assert [len(b["Entries"]) for b in fake.batches] == [10]
+        assert "3" not in {e["Id"] for e in fake.batches[0]["Entries"]}
+
+    async def test_trigger_many_splits_batches_by_size(self):
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        client._sqs = fake = _FakeSQS()
+        blob = "x" * (100 * 1024)
+        events = [("payout.completed", {"object": {"blob": blob}})] * 5
+
+        results = await client.trigger_many(events)
+
+        assert results == [None] * 5
+        assert [len(b["Entries"]) for b in fake.batches] == [2, 2, 1]
+
+    async def test_client_creation_error_is_wrapped(self, monkeypatch):
+        self._install_failing_aioboto3(monkeypatch)
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        with pytest.raises(WebhookClientError, match="no region"):
+            await client.trigger("payout.completed", data={"object": {}})
+        assert client._sqs_client_context is None
+        await client.close()
+
+    async def test_trigger_many_reports_client_creation_error_per_event(
+        self, monkeypatch
+    ):
+        self._install_failing_aioboto3(monkeypatch)
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        results = await client.trigger_many(
+            [("payout.completed", {"object": {}}), ("payout.failed", {"object": {}})]
+        )
+        assert len(results) == 2
+        assert all(isinstance(r, WebhookClientError) for r in results)
+
+    async def test_send_message_body(self):
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        client._sqs = fake = _FakeSQS()
+        result = await client.trigger(
+            "payout.completed", data={"object": {"id": "po_1"}}, account_id=7
+        )
+
+        assert result is None
+        assert fake.messages[0]["QueueUrl"] == self.QUEUE_URL
+        body = json.loads(fake.messages[0]["MessageBody"])
+        assert body["event_type"] == "payout.completed"
+        assert body["account_id"] == "7"
+
+    async def test_trigger_many_batches_by_ten(self):
+        client = WebhookClient(mode="sqs", queue_url=self.QUEUE_URL)
+        client._sqs = fake = _FakeSQS()
+        fake.fail_ids = {"11"}
+        events = [
+            ("payout.completed", {"object": {"id": f"po_{i}"}}) for i in range(12)
+        ]
+
+        results = await client.trigger_many(events, scope_id="merchant_of_record:1")
+
+        assert [len(b["Entries"]) for b in fake.batches] == [10, 2]
+        body = json.loads(fake.batches[1]["Entries"][0]["MessageBody"])
+        assert body["data"]["object"]["id"] == "po_10"
+        assert body["scope_id"] == "merchant_of_record:1"
+        assert results[:11] == [None] * 11
+        assert isinstance(results[11], WebhookClientError)
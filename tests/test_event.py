@@ -85,9 +85,24 @@ class TestEvent:
         assert result["data"]["object"]["id"] == "cb_1"
         assert result["data"]["previous_attributes"]["status"] == "pending"
 
+    def test_to_json_bytes(self):
+        event = Event.from_dict(
+            {
+                "id": "evt_1",
+                "type": "payout.completed",
+                "data": {"object": {"id": "po_1"}},
+            }
+        )
+        assert json.loads(event.to_json_bytes()) == event.to_dict()
+
     def test_event_repr(self):
         event = Event.from_dict(
             {"id": "evt_1", "type": "payout.completed", "data": {"object": {}}}
         )
         assert "evt_1" in repr(event)
         assert "payout.completed" in repr(event)
+
+    def test_event_uses_slots(self):
+        event = Event.from_dict({"id": "evt_1", "type": "payout.completed"})
+        assert not hasattr(event, "__dict__")
+        assert not hasattr(event.data, "__dict__")
@@ -0,0 +1,37 @@
+import json
+import math
+
+import pytest
+
+from turnstay_webhooks import _json
+
+
+class TestJson:
+    def test_dumps_is_compact_bytes(self):
+        assert _json.dumps({"a": 1, "b": [1, 2]}) == b'{"a":1,"b":[1,2]}'
+
+    def test_dumps_non_str_keys(self):
+        assert _json.loads(_json.dumps({1: "x"})) == {"1": "x"}
+
+    def test_loads_bytes_and_str(self):
+        assert _json.loads(b'{"id": "evt_1"}') == {"id": "evt_1"}
+        assert _json.loads('{"id": "evt_1"}') == {"id": "evt_1"}
+
+    def test_big_int_roundtrip_is_exact(self):
+        big = 123456789012345678901234567890
+        assert _json.loads(b'{"n": 123456789012345678901234567890}') == {"n": big}
+        assert _json.loads(_json.dumps({"n": big})) == {"n": big}
+
+    def test_loads_nan_like_stdlib(self):
+        assert math.isnan(_json.loads(b'{"n": NaN}')["n"])
+
+    def test_loads_lone_surrogate_like_stdlib(self):
+        assert _json.loads(b'{"s": "\\ud800"}') == {"s": "\ud800"}
+
+    def test_dumps_unserializable_raises_type_error(self):
+        with pytest.raises(TypeError):
+            _json.dumps({"x": object()})
+
+    def test_loads_invalid_raises_value_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"not json")
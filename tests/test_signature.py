@@ -6,7 +6,7 @@ import time
 import pytest
 
 from turnstay_webhooks.errors import SignatureVerificationError, TimestampTooOldError
-from turnstay_webhooks.signature import WebhookSignature
+from turnstay_webhooks.signature import WebhookSignature, _hmac_template
 
 
 def _sign(secret: str, payload: str, timestamp: str | None = None) -> str:
@@ -38,12 +38,42 @@ class TestWebhookSignature:
         )
         assert result["type"] == "payment_intent.succeeded"
 
+    def test_big_int_payload_is_exact(self):
+        payload = '{"n": 123456789012345678901234567890}'
+        header = _sign(self.SECRET, payload)
+        result = WebhookSignature.verify(payload, header, self.SECRET)
+        assert result["n"] == 123456789012345678901234567890
+
     def test_invalid_signature_raises(self):
         ts = str(int(time.time()))
         header = f"t={ts}, v1=bad_signature_value"
         with pytest.raises(SignatureVerificationError):
             WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
 
+    def test_only_malformed_v1_raises_no_match(self):
+        ts = str(int(time.time()))
+        header = f"t={ts}, v1=not_hex"
+        with pytest.raises(SignatureVerificationError, match="No matching signature"):
+            WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+    def test_uppercase_hex_signature(self):
+        ts, _, sig = _sign(self.SECRET, self.PAYLOAD).partition(", v1=")
+        header = f"{ts}, v1={sig.upper()}"
+        result = WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+        assert result["type"] == "payment_intent.succeeded"
+
+    def test_second_of_multiple_signatures_matches(self):
+        header = _sign(self.SECRET, self.PAYLOAD)
+        header = header.replace("v1=", f"v1={'00' * 32}, v1=", 1)
+        result = WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+        assert result["type"] == "payment_intent.succeeded"
+
+    def test_no_match_among_multiple_signatures_raises(self):
+        ts = str(int(time.time()))
+        header = f"t={ts}, v1={'00' * 32}, v1={'ff' * 32}"
+        with pytest.raises(SignatureVerificationError, match="No matching signature"):
+            WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
     def test_wrong_secret_raises(self):
         header = _sign(self.SECRET, self.PAYLOAD)
         with pytest.raises(SignatureVerificationError):
@@ -55,6 +85,12 @@ class TestWebhookSignature:
         with pytest.raises(TimestampTooOldError):
             WebhookSignature.verify(self.PAYLOAD, header, self.SECRET, tolerance=300)
 
+    def test_future_timestamp_raises(self):
+        future_ts = str(int(time.time()) + 600)
+        header = _sign(self.SECRET, self.PAYLOAD, timestamp=future_ts)
+        with pytest.raises(TimestampTooOldError, match="exceeds tolerance"):
+            WebhookSignature.verify(self.PAYLOAD, header, self.SECRET, tolerance=300)
+
     def test_missing_timestamp_raises(self):
         header = "v1=somesig"
         with pytest.raises(SignatureVerificationError, match="Missing timestamp"):
@@ -70,3 +106,82 @@ class TestWebhookSignature:
         header = _sign(self.SECRET, self.PAYLOAD, timestamp=old_ts)
         result = WebhookSignature.verify(self.PAYLOAD, header, self.SECRET, tolerance=0)
         assert result["type"] == "payment_intent.succeeded"
+
+    def test_malformed_v1_is_skipped(self):
+        header = _sign(self.SECRET, self.PAYLOAD)
+        header = header.replace("v1=", "v1=not_hex, v1=", 1)
+        result = WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+        assert result["type"] == "payment_intent.succeeded"
+
+    def test_invalid_timestamp_raises(self):
+        header = _sign(self.SECRET, self.PAYLOAD, timestamp="soon")
+        with pytest.raises(SignatureVerificationError, match="Invalid timestamp"):
+            WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+    def test_verify_only_valid(self):
+        payload = b"not json, but signed"
+        header = _sign(self.SECRET, payload.decode("utf-8"))
+        assert WebhookSignature.verify_only(payload, header, self.SECRET) is None
+
+    def test_verify_only_wrong_secret_raises(self):
+        header = _sign(self.SECRET, self.PAYLOAD)
+        with pytest.raises(SignatureVerificationError):
+            WebhookSignature.verify_only(self.PAYLOAD, header, "wrong_secret")
+
+
+class TestParseHeader:
+    SECRET = "whsec_test_secret_123"
+    PAYLOAD = '{"type": "payout.completed"}'
+
+    def _parts(self) -> tuple[str, str]:
+        ts, _, sig = _sign(self.SECRET, self.PAYLOAD).partition(", v1=")
+        return ts.removeprefix("t="), sig
+
+    def test_whitespace_around_separators(self):
+        ts, sig = self._parts()
+        header = f" t = {ts} ,  v1 =  {sig} "
+        assert WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+    def test_unknown_items_are_ignored(self):
+        ts, sig = self._parts()
+        header = f"t={ts}, v0=deadbeef, v1={sig}"
+        assert WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+    def test_only_unknown_scheme_raises(self):
+        ts, sig = self._parts()
+        with pytest.raises(SignatureVerificationError, match="No v1 signature"):
+            WebhookSignature.verify(self.PAYLOAD, f"t={ts}, v0={sig}", self.SECRET)
+
+    def test_v10_is_not_v1(self):
+        ts, sig = self._parts()
+        with pytest.raises(SignatureVerificationError, match="No v1 signature"):
+            WebhookSignature.verify(self.PAYLOAD, f"t={ts}, v10={sig}", self.SECRET)
+
+    def test_repeated_timestamp_last_wins(self):
+        ts, sig = self._parts()
+        header = f"t=1, t={ts}, v1={sig}"
+        assert WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+    def test_empty_timestamp_raises(self):
+        _, sig = self._parts()
+        with pytest.raises(SignatureVerificationError, match="Invalid timestamp"):
+            WebhookSignature.verify(self.PAYLOAD, f"t=, v1={sig}", self.SECRET)
+
+    def test_timestamp_with_space_raises(self):
+        ts, sig = self._parts()
+        header = f"t={ts[:5]} {ts[5:]}, v1={sig}"
+        with pytest.raises(SignatureVerificationError, match="Invalid timestamp"):
+            WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+    def test_signature_with_space_does_not_match(self):
+        ts, sig = self._parts()
+        header = f"t={ts}, v1={sig[:32]} {sig[32:]}"
+        with pytest.raises(SignatureVerificationError, match="No matching signature"):
+            WebhookSignature.verify(self.PAYLOAD, header, self.SECRET)
+
+
+class TestHmacTemplate:
+    def test_uses_openssl_hmac(self):
+        _hashlib = pytest.importorskip("_hashlib")
+        template = _hmac_template("whsec_test_secret_123")
+        assert isinstance(getattr(template, "_hmac", None), _hashlib.HMAC)
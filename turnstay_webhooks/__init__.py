@@ -1,4 +1,5 @@
-from .client import WebhookClient
+from typing import TYPE_CHECKING, Any
+
 from .errors import (
     SignatureVerificationError,
     TimestampTooOldError,
@@ -8,6 +9,9 @@ from .errors import (
 from .event import Event, EventData
 from .signature import WebhookSignature
 
+if TYPE_CHECKING:
+    from .client import WebhookClient
+
 __all__ = [
     "WebhookClient",
     "WebhookSignature",
@@ -18,3 +22,14 @@ __all__ = [
     "SignatureVerificationError",
     "TimestampTooOldError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # WebhookClient pulls in httpx; import it only when used so signature-only
+    # consumers start faster.
+    if name == "WebhookClient":
+        from .client import WebhookClient
+
+        globals()["WebhookClient"] = WebhookClient
+        return WebhookClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
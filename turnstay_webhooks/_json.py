@@ -0,0 +1,47 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib.
+
+Results match the stdlib: input orjson rejects (integers outside 64 bits,
+NaN/Infinity literals, lone surrogate escapes) is handled by the json module,
+and bodies containing 20+ digit runs are parsed by it so large integers are
+never turned into floats. The one remaining difference is that orjson
+serializes float NaN/Infinity values as null.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # no cov
+    orjson = None
+
+# Integers with 20+ digits may not fit in 64 bits, which orjson parses as floats.
+_LONG_DIGITS_BYTES_RE = re.compile(rb"\d{20}")
+_LONG_DIGITS_STR_RE = re.compile(r"\d{20}")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 encoded JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        pattern = (
+            _LONG_DIGITS_STR_RE if isinstance(data, str) else _LONG_DIGITS_BYTES_RE
+        )
+        if pattern.search(data) is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
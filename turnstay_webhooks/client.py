@@ -1,16 +1,34 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import random
 from typing import Any
 
 import httpx
 
+from . import _json
 from .errors import WebhookClientError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+SQS_MAX_BATCH_SIZE = 10
+# SendMessageBatch also limits the combined size of all message bodies.
+SQS_MAX_BATCH_BYTES = 256 * 1024
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return a Retry-After header given in seconds, or None if absent or not numeric."""
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if seconds >= 0 else None
+
 
 class WebhookClient:
     """Async client for emitting webhook events to the TurnStay webhook-service.
@@ -23,6 +41,10 @@ class WebhookClient:
 
     For local dev with base_url override:
         client = WebhookClient(api_key="dev-token", base_url="http://localhost:8000")
+
+    To reuse pooled connections across clients, share one process-wide httpx client:
+        shared = httpx.AsyncClient(limits=DEFAULT_LIMITS)
+        client = WebhookClient(api_key="...", environment="staging", client=shared)
     """
 
     def __init__(
@@ -33,10 +55,13 @@ class WebhookClient:
         timeout: float = 5.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
         mode: str = "http",
         queue_url: str | None = None,
         region_name: str = "eu-west-1",
         headers: dict[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 10,
     ):
         """
         Args:
@@ -45,11 +70,14 @@ class WebhookClient:
             base_url: Override for local dev (e.g. http://localhost:8000). If set, used instead of derived URL.
             timeout: HTTP request timeout in seconds.
             max_retries: Number of retries on transient failure.
-            retry_delay: Base delay between retries (exponential backoff).
+            retry_delay: Base delay between retries (decorrelated jitter backoff).
+            max_retry_delay: Upper bound for a single retry delay, including Retry-After.
             mode: Transport mode - "http" or "sqs".
             queue_url: SQS queue URL (required for SQS mode).
             region_name: AWS region for SQS.
             headers: Optional extra headers (Authorization is always added from api_key).
+            client: Optional shared httpx.AsyncClient. It is not closed by close().
+            max_concurrency: Maximum in-flight HTTP requests for trigger_many.
         """
         self.api_key = api_key
         self.mode = mode
@@ -64,23 +92,33 @@ class WebhookClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_concurrency = max_concurrency
         self.queue_url = queue_url
         self.region_name = region_name
         auth_headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
         self.headers = {**(headers or {}), **auth_headers}
-        self._http_client: httpx.AsyncClient | None = None
+        self._trigger_url = f"{self.base_url}/internal/webhooks/trigger"
+        self._http_client: httpx.AsyncClient | None = client
+        self._owns_http_client = client is None
+        self._sqs_client_context: Any = None
+        self._sqs: Any = None
+        self._sqs_lock = asyncio.Lock()
 
         if mode == "http" and not self.base_url:
             raise WebhookClientError("base_url or environment required for HTTP mode")
         if mode == "sqs" and not queue_url:
             raise WebhookClientError("queue_url is required for SQS mode")
+        if max_concurrency < 1:
+            raise WebhookClientError("max_concurrency must be at least 1")
 
     @property
     def http_client(self) -> httpx.AsyncClient:
         if self._http_client is None or self._http_client.is_closed:
             self._http_client = httpx.AsyncClient(
-                timeout=self.timeout, headers=self.headers
+                timeout=self.timeout, limits=DEFAULT_LIMITS
             )
+            self._owns_http_client = True
         return self._http_client
 
     async def trigger(
@@ -106,35 +144,108 @@ class WebhookClient:
         Raises:
             WebhookClientError: If all retries are exhausted or configuration is wrong.
         """
-        if name is None:
-            name = event_type
+        payload = self._build_payload(event_type, data, name, scope_id, account_id)
+        if self.mode == "sqs":
+            return await self._send_sqs(payload)
+        return await self._send_http(payload)
+
+    async def trigger_many(
+        self,
+        events: list[tuple[str, dict[str, Any]]],
+        scope_id: str | None = None,
+        account_id: str | None = None,
+    ) -> list[dict[str, Any] | WebhookClientError | None]:
+        """Emit several webhook events.
+
+        In SQS mode events are sent with SendMessageBatch, up to 10 events and
+        256 KiB of message bodies per request.
+        In HTTP mode up to max_concurrency requests are sent concurrently.
+
+        Args:
+            events: (event_type, data) pairs, one per event.
+            scope_id: Scope applied to every event.
+            account_id: Account scope applied to every event.
+
+        Returns:
+            One entry per event, in order: the response dict (HTTP mode) or None
+            (SQS mode), or the WebhookClientError for an event that was not sent.
+
+        Raises:
+            WebhookClientError: If the client configuration is wrong.
+        """
+        payloads = [
+            self._build_payload(event_type, data, None, scope_id, account_id)
+            for event_type, data in events
+        ]
+        if self.mode == "sqs":
+            return await self._send_sqs_batch(payloads)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send(
+            payload: dict[str, Any],
+        ) -> dict[str, Any] | WebhookClientError:
+            async with semaphore:
+                try:
+                    return await self._send_http(payload)
+                except WebhookClientError as e:
+                    return e
+
+        tasks = [asyncio.create_task(send(p)) for p in payloads]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
+    @staticmethod
+    def _build_payload(
+        event_type: str,
+        data: dict[str, Any],
+        name: str | None,
+        scope_id: str | None,
+        account_id: str | None,
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "event_type": event_type,
-            "name": name,
+            "name": event_type if name is None else name,
             "data": data,
         }
         if scope_id is not None:
             payload["scope_id"] = str(scope_id)
         if account_id is not None:
             payload["account_id"] = str(account_id)
-
-        if self.mode == "sqs":
-            return await self._send_sqs(payload)
-        return await self._send_http(payload)
+        return payload
 
     async def _send_http(self, payload: dict[str, Any]) -> dict[str, Any]:
-        url = f"{self.base_url}/internal/webhooks/trigger"
+        try:
+            body = _json.dumps(payload)
+        except (TypeError, ValueError) as e:
+            raise WebhookClientError(f"Failed to serialize payload: {e}") from e
+        headers = {**self.headers, "Content-Type": "application/json"}
         last_error: Exception | None = None
+        backoff = self.retry_delay
 
         for attempt in range(self.max_retries + 1):
+            retry_after: float | None = None
             try:
-                response = await self.http_client.post(url, json=payload)
-                if response.status_code < 500:
+                response = await self.http_client.post(
+                    self._trigger_url,
+                    content=body,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    if response.status_code >= 500:
+                        raise WebhookClientError(
+                            f"Server error {response.status_code}: {response.text}"
+                        )
                     return response.json()
                 last_error = WebhookClientError(
-                    f"Server error {response.status_code}: {response.text}"
+                    f"Retryable error {response.status_code}: {response.text}"
                 )
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
             except (
                 httpx.TimeoutException,
                 httpx.ConnectError,
@@ -142,11 +253,19 @@ class WebhookClient:
                 httpx.ReadError,
             ) as e:
                 last_error = e
-            except Exception as e:
+            except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+                # Non-transient transport/protocol errors and undecodable JSON bodies.
                 raise WebhookClientError(f"Unexpected error: {e}") from e
 
             if attempt < self.max_retries:
-                delay = self.retry_delay * (2**attempt)
+                if retry_after is not None:
+                    delay = min(retry_after, self.max_retry_delay)
+                else:
+                    backoff = min(
+                        self.max_retry_delay,
+                        random.uniform(self.retry_delay, backoff * 3),  # nosec B311
+                    )
+                    delay = backoff
                 logger.warning(
                     "Webhook trigger attempt %d/%d failed, retrying in %.1fs: %s",
                     attempt + 1,
@@ -160,27 +279,115 @@ class WebhookClient:
             f"Failed to trigger webhook after {self.max_retries + 1} attempts: {last_error}"
         )
 
+    async def _get_sqs(self) -> Any:
+        """Create the aioboto3 SQS client on first use and reuse it afterwards."""
+        async with self._sqs_lock:
+            if self._sqs is None:
+                try:
+                    import aioboto3
+                except ImportError:
+                    raise WebhookClientError(
+                        "aioboto3 is required for SQS mode. Install with: pip install aioboto3"
+                    ) from None
+                try:
+                    context = aioboto3.Session().client(
+                        "sqs", region_name=self.region_name
+                    )
+                    sqs = await context.__aenter__()
+                except Exception as e:
+                    raise WebhookClientError(f"Failed to create SQS client: {e}") from e
+                self._sqs_client_context = context
+                self._sqs = sqs
+        return self._sqs
+
     async def _send_sqs(self, payload: dict[str, Any]) -> None:
         """Send event via SQS (for production environments)."""
         try:
-            import boto3
-
-            sqs = boto3.client("sqs", region_name=self.region_name)
-            sqs.send_message(
+            sqs = await self._get_sqs()
+            await sqs.send_message(
                 QueueUrl=self.queue_url,
-                MessageBody=json.dumps(payload),
+                MessageBody=_json.dumps(payload).decode("utf-8"),
             )
             logger.info("Webhook event sent to SQS: %s", payload.get("event_type"))
-        except ImportError:
-            raise WebhookClientError(
-                "boto3 is required for SQS mode. Install with: pip install boto3"
-            ) from None
+        except WebhookClientError:
+            raise
         except Exception as e:
             raise WebhookClientError(f"Failed to send to SQS: {e}") from e
 
+    async def _send_sqs_batch(
+        self, payloads: list[dict[str, Any]]
+    ) -> list[WebhookClientError | None]:
+        """Send events via SQS SendMessageBatch, reporting failures per event."""
+        try:
+            sqs = await self._get_sqs()
+        except WebhookClientError as e:
+            return [e] * len(payloads)
+        results: list[WebhookClientError | None] = [None] * len(payloads)
+        entries: list[dict[str, str]] = []
+        entries_bytes = 0
+
+        for index, payload in enumerate(payloads):
+            try:
+                body = _json.dumps(payload)
+            except (TypeError, ValueError) as e:
+                error = WebhookClientError(f"Failed to serialize payload: {e}")
+                error.__cause__ = e
+                results[index] = error
+                continue
+
+            if entries and (
+                len(entries) == SQS_MAX_BATCH_SIZE
+                or entries_bytes + len(body) > SQS_MAX_BATCH_BYTES
+            ):
+                await self._send_sqs_entries(sqs, entries, results)
+                entries, entries_bytes = [], 0
+            entries.append({"Id": str(index), "MessageBody": body.decode("utf-8")})
+            entries_bytes += len(body)
+
+        if entries:
+            await self._send_sqs_entries(sqs, entries, results)
+        return results
+
+    async def _send_sqs_entries(
+        self,
+        sqs: Any,
+        entries: list[dict[str, str]],
+        results: list[WebhookClientError | None],
+    ) -> None:
+        """Send one SendMessageBatch request, recording failures by entry Id."""
+        try:
+            response = await sqs.send_message_batch(
+                QueueUrl=self.queue_url, Entries=entries
+            )
+        except Exception as e:
+            error = WebhookClientError(f"Failed to send to SQS: {e}")
+            error.__cause__ = e
+            for entry in entries:
+                results[int(entry["Id"])] = error
+            return
+
+        failed_entries = response.get("Failed", [])
+        for failed in failed_entries:
+            results[int(failed["Id"])] = WebhookClientError(
+                f"Failed to send to SQS: {failed.get('Message', failed.get('Code'))}"
+            )
+        logger.info(
+            "Webhook event batch sent to SQS: %d/%d events",
+            len(entries) - len(failed_entries),
+            len(entries),
+        )
+
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        if self._http_client and not self._http_client.is_closed:
+        """Close the SQS client and the HTTP client, unless it was provided by the caller."""
+        if self._sqs_client_context is not None:
+            await self._sqs_client_context.__aexit__(None, None, None)
+            self._sqs_client_context = None
+            self._sqs = None
+        if (
+            self._owns_http_client
+            and self._http_client
+            and not self._http_client.is_closed
+        ):
             await self._http_client.aclose()
 
     async def __aenter__(self) -> WebhookClient:
@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from . import _json
 from .signature import WebhookSignature
 
 
-@dataclass
+@dataclass(slots=True)
 class EventData:
     """Represents the data payload of a webhook event."""
 
@@ -21,7 +22,7 @@ class EventData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a TurnStay webhook event.
 
@@ -99,5 +100,9 @@ class Event:
             result["data"]["previous_attributes"] = self.data.previous_attributes
         return result
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the event to compact JSON bytes (same shape as to_dict)."""
+        return _json.dumps(self.to_dict())
+
     def __repr__(self) -> str:
         return f"<Event id={self.id} type={self.type}>"
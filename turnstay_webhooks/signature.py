@@ -1,12 +1,31 @@
+import functools
 import hashlib
 import hmac
-import json
-import time
+import re
+from hmac import compare_digest as _compare_digest
+from time import time as _now
 
+from . import _json
 from .errors import SignatureVerificationError, TimestampTooOldError
 
 DEFAULT_TOLERANCE = 300  # 5 minutes
 
+# Matches the "t" and "v1" items of a Turnstay-Signature header in one pass;
+# unknown items are skipped and values are captured up to the next comma,
+# without surrounding whitespace.
+_HEADER_ITEM_RE = re.compile(r"(?:^|,)\s*(t|v1)\s*=\s*([^,]*?)\s*(?=,|$)")
+
+
+@functools.lru_cache(maxsize=128)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state for a secret, padded key already absorbed; copy before use.
+
+    Cached per secret string, so the secret is only UTF-8 encoded on a cache miss.
+    """
+    # hashlib.sha256 is OpenSSL-backed, so hmac uses OpenSSL's HMAC (hardware
+    # SHA-256 where the CPU supports it) rather than its pure-Python fallback.
+    return hmac.new(secret.encode("utf-8"), b"", hashlib.sha256)
+
 
 class WebhookSignature:
     """Utility for verifying TurnStay webhook signatures.
@@ -40,60 +59,95 @@ class WebhookSignature:
             SignatureVerificationError: If the signature doesn't match.
             TimestampTooOldError: If the timestamp is outside the tolerance window.
         """
-        if isinstance(payload, bytes):
-            payload_str = payload.decode("utf-8")
-        else:
-            payload_str = payload
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        WebhookSignature._verify_raw(payload, signature_header, secret, tolerance)
+        return _json.loads(payload)
+
+    @staticmethod
+    def verify_only(
+        payload: bytes | str,
+        signature_header: str,
+        secret: str,
+        tolerance: int = DEFAULT_TOLERANCE,
+    ) -> None:
+        """Verify a webhook signature without parsing the payload.
+
+        Use this when only authentication is needed, e.g. when forwarding the raw
+        body downstream. Arguments and errors are the same as for verify().
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        WebhookSignature._verify_raw(payload, signature_header, secret, tolerance)
 
+    @staticmethod
+    def _verify_raw(
+        payload: bytes, signature_header: str, secret: str, tolerance: int
+    ) -> None:
+        """Check the timestamp and HMAC signature of a raw payload."""
         timestamp, signatures = WebhookSignature._parse_header(signature_header)
 
         if tolerance > 0:
-            age = abs(time.time() - int(timestamp))
+            try:
+                ts_int = int(timestamp)
+            except ValueError:
+                raise SignatureVerificationError(
+                    "Invalid timestamp in signature header"
+                ) from None
+            now = int(_now())
+            age = now - ts_int if now >= ts_int else ts_int - now
             if age > tolerance:
                 raise TimestampTooOldError(
-                    f"Timestamp is {int(age)}s old, exceeds tolerance of {tolerance}s"
+                    f"Timestamp is {age}s old, exceeds tolerance of {tolerance}s"
                 )
 
-        expected = WebhookSignature._compute_signature(secret, timestamp, payload_str)
+        expected = WebhookSignature._compute_signature(secret, timestamp, payload)
 
-        matched = any(hmac.compare_digest(expected, sig) for sig in signatures)
+        if len(signatures) == 1:
+            matched = _compare_digest(expected, signatures[0])
+        else:
+            matched = any(_compare_digest(expected, sig) for sig in signatures)
         if not matched:
             raise SignatureVerificationError("No matching signature found")
 
-        return json.loads(payload_str)
-
     @staticmethod
-    def _parse_header(header: str) -> tuple[str, list[str]]:
-        """Parse the Turnstay-Signature header into timestamp and signature list."""
+    def _parse_header(header: str) -> tuple[str, list[bytes]]:
+        """Parse the Turnstay-Signature header into timestamp and raw signature digests.
+
+        Malformed (non-hex) v1 values are skipped, so they never match.
+        """
         timestamp = None
         signatures = []
+        has_v1 = False
 
-        for item in header.split(","):
-            item = item.strip()
-            if "=" not in item:
-                continue
-            key, value = item.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-
+        for key, value in _HEADER_ITEM_RE.findall(header):
             if key == "t":
                 timestamp = value
-            elif key == "v1":
-                signatures.append(value)
+            else:
+                has_v1 = True
+                try:
+                    signature = bytes.fromhex(value)
+                except ValueError:
+                    continue
+                # bytes.fromhex skips whitespace; only accept contiguous hex.
+                if len(signature) * 2 == len(value):
+                    signatures.append(signature)
 
         if timestamp is None:
             raise SignatureVerificationError("Missing timestamp in signature header")
-        if not signatures:
+        if not has_v1:
             raise SignatureVerificationError("No v1 signature found in header")
 
         return timestamp, signatures
 
     @staticmethod
-    def _compute_signature(secret: str, timestamp: str, payload: str) -> str:
-        """Compute HMAC-SHA256 signature matching the webhook-service's signing logic."""
-        to_sign = f"{timestamp}.{payload}"
-        return hmac.new(
-            secret.encode("utf-8"),
-            to_sign.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+    def _compute_signature(secret: str, timestamp: str, payload: bytes) -> bytes:
+        """Compute the raw HMAC-SHA256 digest matching the webhook-service's signing logic.
+
+        The signed message is "{timestamp}.{payload}"; the payload is fed to the HMAC
+        as-is so the request body is never copied or re-encoded.
+        """
+        h = _hmac_template(secret).copy()
+        h.update(timestamp.encode("utf-8") + b".")
+        h.update(payload)
+        return h.digest()